@@ -1,12 +1,24 @@
 #!/usr/bin/env bash
 set -euo pipefail
 
-# Build Linux binary for vox-send.py using PyInstaller.
+# Build Linux binaries for vox.py (unified `vox` CLI) and vox-send.py using PyInstaller.
 # Run from the repo root on a Linux host with python3 and PyInstaller installed.
+#
+# Usage: ./compile-linux.sh [--onedir]
+#   --onedir  Build unpacked directories instead of self-extracting --onefile
+#             binaries. Avoids the per-launch extraction to a temp dir, so
+#             every start is a warm start.
+
+MODE="--onefile"
+if [ "${1:-}" = "--onedir" ]; then
+  MODE="--onedir"
+fi
 
 DIST_DIR="dist/linux"
 BUILD_DIR="build/linux"
-TARGETS=("vox-send.py")
+TARGETS=("vox.py" "vox-send.py")
+# Scripts loaded on demand by `vox <subcommand>`; bundled as data next to vox.py.
+SUBCOMMAND_SCRIPTS=("vox-send.py" "vox-test.py" "vox-meter.py" "vox-probe.py" "list-input-keys.py")
 
 rm -rf "$DIST_DIR" "$BUILD_DIR"
 mkdir -p "$DIST_DIR"
@@ -15,13 +27,23 @@ for target in "${TARGETS[@]}"; do
   name="${target%.py}"
   target_build="$BUILD_DIR/$name"
   mkdir -p "$target_build"
+  extra_args=()
+  if [ "$target" = "vox.py" ]; then
+    for script in "${SUBCOMMAND_SCRIPTS[@]}"; do
+      extra_args+=(--add-data "$PWD/$script:.")
+    done
+    # Imports of the on-demand scripts are invisible to PyInstaller's analysis.
+    extra_args+=(--hidden-import numpy --hidden-import sounddevice --hidden-import evdev)
+  fi
   python3 -m PyInstaller \
-    --onefile \
+    "$MODE" \
     --windowed \
+    --noupx \
     --name "$name" \
     --distpath "$DIST_DIR" \
     --workpath "$target_build" \
     --specpath "$target_build" \
     --clean \
+    ${extra_args[@]+"${extra_args[@]}"} \
     "$target"
 done
@@ -1,30 +1,53 @@
+param(
+    # Build an unpacked directory instead of a self-extracting --onefile exe,
+    # which avoids the per-launch extraction to a temp dir.
+    [switch]$OneDir
+)
+
 $ErrorActionPreference = "Stop"
 
-# Build Windows binary for vox.py using PyInstaller.
-# Run from the repo root on Windows with Python and PyInstaller installed.
+# Build Windows binaries for vox.py using PyInstaller:
+#   vox.exe      console app, the unified `vox` CLI (send, test, meter, ...)
+#   vox-gui.exe  windowed app for the listener, without a console window
+# A windowed exe has no stdout/stderr, so the CLI subcommands need the
+# console build. Run from the repo root on Windows with Python and
+# PyInstaller installed.
 
 $dist = "dist\windows"
 $build = "build\windows"
 $asset = Join-Path $PSScriptRoot "assets\nosphere-vox.png"
-$targets = @("vox.py")
+$targets = @(
+    @{ Script = "vox.py"; Name = "vox"; Console = "--console" },
+    @{ Script = "vox.py"; Name = "vox-gui"; Console = "--windowed" }
+)
+# Scripts loaded on demand by `vox <subcommand>`; bundled as data next to vox.py.
+$subcommandScripts = @("vox-send.py", "vox-test.py", "vox-meter.py", "vox-probe.py")
+$mode = if ($OneDir) { "--onedir" } else { "--onefile" }
 
 if (Test-Path $dist) { Remove-Item -Recurse -Force $dist -ErrorAction SilentlyContinue }
 if (Test-Path $build) { Remove-Item -Recurse -Force $build -ErrorAction SilentlyContinue }
 New-Item -ItemType Directory -Force -Path $dist | Out-Null
 
 foreach ($target in $targets) {
-    $name = [System.IO.Path]::GetFileNameWithoutExtension($target)
+    $name = $target.Name
     $targetBuild = Join-Path $build $name
     New-Item -ItemType Directory -Force -Path $targetBuild | Out-Null
 
     $iconArg = @()
-    if ($target -eq "vox.py") {
+    $extraArgs = @()
+    if ($target.Script -eq "vox.py") {
         $iconArg = @("--icon", "$PSScriptRoot\assets\nosphere-vox.png")
+        foreach ($script in $subcommandScripts) {
+            $extraArgs += @("--add-data", "$(Join-Path $PSScriptRoot $script);.")
+        }
+        # Imports of the on-demand scripts are invisible to PyInstaller's analysis.
+        $extraArgs += @("--hidden-import", "numpy", "--hidden-import", "sounddevice")
     }
 
     python -m PyInstaller `
-        --onefile `
-        --windowed `
+        $mode `
+        $target.Console `
+        --noupx `
         --name $name `
         --distpath $dist `
         --workpath $targetBuild `
@@ -32,5 +55,6 @@ foreach ($target in $targets) {
         --clean `
         --add-data "$asset;assets" `
         @iconArg `
-        $target
+        @extraArgs `
+        $target.Script
 }
@@ -1,8 +1,19 @@
 #!/usr/bin/env python3
-import evdev
+import argparse
+import os
 
+STARTUP_PROBE_ENV = "VOX_EXIT_AFTER_IMPORTS"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Print key events from all evdev input devices")
+    parser.parse_args(argv)
+
+    import evdev
+
+    if os.environ.get(STARTUP_PROBE_ENV):
+        return
 
-def main():
     devices = [evdev.InputDevice(path) for path in evdev.list_devices()]
     if not devices:
         print("No input devices found.")
@@ -1,14 +1,16 @@
 #!/usr/bin/env python3
 import argparse
+import os
 import subprocess
 import sys
 import time
 
-import numpy as np
-import sounddevice as sd
+STARTUP_PROBE_ENV = "VOX_EXIT_AFTER_IMPORTS"
 
 
 def list_devices():
+    import sounddevice as sd
+
     try:
         devices = sd.query_devices()
     except Exception as exc:
@@ -21,6 +23,8 @@ def list_devices():
 
 
 def find_monitor_device():
+    import sounddevice as sd
+
     # Try pactl to find a sink monitor name.
     try:
         result = subprocess.run(
@@ -53,6 +57,9 @@ def find_monitor_device():
 
 
 def capture(device):
+    import numpy as np
+    import sounddevice as sd
+
     # Accept numeric device index or name.
     try:
         device_ref = int(device)
@@ -115,10 +122,18 @@ def capture(device):
         sys.exit(1)
 
 
-def main():
+def main(argv=None):
     parser = argparse.ArgumentParser(description="Simple input level meter")
     parser.add_argument("device", nargs="?", help="Device name/index. If omitted, devices are listed and the program exits.")
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+
+    # The helpers import these lazily; load them up front so a bench run
+    # (STARTUP_PROBE_ENV) measures the same start cost as a real one.
+    import numpy
+    import sounddevice
+
+    if os.environ.get(STARTUP_PROBE_ENV):
+        return
 
     if not args.device:
         monitor = find_monitor_device()
@@ -1,12 +1,18 @@
 #!/usr/bin/env python3
+import os
 import socket
 
-def main():
+STARTUP_PROBE_ENV = "VOX_EXIT_AFTER_IMPORTS"
+
+def main(argv=None):
     import argparse
 
     parser = argparse.ArgumentParser(description="Simple UDP probe")
     parser.add_argument("--port", type=int, default=5004, help="UDP port to bind (default: 5004)")
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+
+    if os.environ.get(STARTUP_PROBE_ENV):
+        return
 
     sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
     sock.bind(("0.0.0.0", args.port))
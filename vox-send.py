@@ -4,9 +4,6 @@ import socket
 import sys
 import time
 from pathlib import Path
-
-import numpy as np
-import sounddevice as sd
 import subprocess
 import os
 
@@ -22,6 +19,25 @@ CONFIG_FILE = CONFIG_DIR / "config.txt"
 CONFIG_TARGET_KEY = "target_ip"
 SINK_NAME = "vox_meter"
 SINK_DESC = "Vox_Meter"
+STARTUP_PROBE_ENV = "VOX_EXIT_AFTER_IMPORTS"
+# Input recovery: reopen attempts back off from the min, doubling up to the max.
+RECOVER_MIN_BACKOFF = 0.1
+RECOVER_MAX_BACKOFF = 2.0
+# PortAudio only re-enumerates devices at init, which invalidates every open
+# stream. Once a source has failed this many attempts while others still run,
+# all inputs are closed so the next attempt re-inits and reopens them all;
+# repeat restarts back off from the min, doubling up to the max.
+RESTART_AFTER_ATTEMPTS = 3
+RESTART_MIN_INTERVAL = 1.0
+RESTART_MAX_INTERVAL = 30.0
+TRUNK_CODECS = ("pcm16", "mulaw")
+# Trunk datagram limits, as in vox_trunk (kept here so --help stays numpy-free).
+# The default is three 1480-byte IP fragments on a 1500-byte MTU, the same wire
+# shape as one per-stream pcm16 datagram; 1472 avoids IP fragmentation.
+TRUNK_DEFAULT_BYTES = 4432
+TRUNK_MTU_BYTES = 1472
+TRUNK_MIN_BYTES = 128
+TRUNK_MAX_BYTES = 65507
 
 
 def load_config_target():
@@ -37,13 +53,54 @@ def load_config_target():
     return None
 
 
-def main():
+def parse_source(spec):
+    """Parse `DEVICE[;codec=pcm16|mulaw]` into (device, codec); codec is None if not given."""
+    device, _, option = spec.partition(";")
+    device = device.strip() or "pulse"
+    codec = None
+    if option:
+        key, _, value = option.partition("=")
+        if key.strip() != "codec" or value.strip() not in TRUNK_CODECS:
+            raise argparse.ArgumentTypeError(f"bad source '{spec}': expected DEVICE[;codec={'|'.join(TRUNK_CODECS)}]")
+        codec = value.strip()
+    return (int(device) if device.isdigit() else device), codec
+
+
+def trunk_bytes(value):
+    size = int(value)
+    if not TRUNK_MIN_BYTES <= size <= TRUNK_MAX_BYTES:
+        raise argparse.ArgumentTypeError(f"must be {TRUNK_MIN_BYTES}..{TRUNK_MAX_BYTES}")
+    return size
+
+
+def main(argv=None):
     parser = argparse.ArgumentParser(description="Headless sender")
     parser.add_argument("--ip", help="Target IP (overrides config)")
     parser.add_argument("--port", type=int, default=PORT, help="Target UDP port (default: 5004)")
     parser.add_argument("-v", "--verbose", action="store_true", help="Enable periodic console logs")
     parser.add_argument("--no-auto-sink", action="store_true", help="Disable auto sink setup (vox_meter) on Linux.")
-    args = parser.parse_args()
+    parser.add_argument(
+        "--source",
+        action="append",
+        type=parse_source,
+        metavar="DEVICE[;codec=C]",
+        help="Input device to send; repeatable. Stream N goes to port+N, or is trunk stream id N with --trunk "
+        "(default: pulse; codec defaults to mulaw with --trunk, else pcm16)",
+    )
+    parser.add_argument("--trunk", action="store_true", help="Pack every source's block into few datagrams per tick")
+    parser.add_argument(
+        "--trunk-max-bytes",
+        type=trunk_bytes,
+        default=TRUNK_DEFAULT_BYTES,
+        metavar="BYTES",
+        help=f"Datagram size limit for --trunk; blocks are split to fit (default: {TRUNK_DEFAULT_BYTES}, "
+        f"three 1500-byte MTU fragments; {TRUNK_MTU_BYTES} avoids IP fragmentation, 8972 suits jumbo frames)",
+    )
+    args = parser.parse_args(argv)
+    default_codec = "mulaw" if args.trunk else "pcm16"
+    sources = [(device, codec or default_codec) for device, codec in args.source or [("pulse", None)]]
+    if not args.trunk and any(codec != "pcm16" for _, codec in sources):
+        parser.error("codecs other than pcm16 need --trunk")
 
     target_ip = args.ip or load_config_target()
     if not target_ip:
@@ -51,21 +108,36 @@ def main():
         sys.exit(1)
     port = args.port
 
-    device = "pulse"
-    try:
-        sd.check_input_settings(
-            device=device,
-            samplerate=SAMPLE_RATE,
-            channels=CHANNELS,
-            dtype="int16",
-        )
-    except Exception as exc:
-        print(f"Device check failed for '{device}': {exc}", file=sys.stderr)
-        sys.exit(1)
+    import numpy as np
+    import sounddevice as sd
+
+    packer = None
+    if args.trunk:
+        import vox_trunk
+
+        packer = vox_trunk.TrunkPacker(args.trunk_max_bytes)
+
+    if os.environ.get(STARTUP_PROBE_ENV):
+        return
+
+    for device, _ in sources:
+        try:
+            sd.check_input_settings(
+                device=device,
+                samplerate=SAMPLE_RATE,
+                channels=CHANNELS,
+                dtype="int16",
+            )
+        except Exception as exc:
+            print(f"Device check failed for '{device}': {exc}", file=sys.stderr)
+            sys.exit(1)
 
-    print(f"Headless meter/send: device='{device}', target={target_ip}:{port}")
+    devices = ", ".join(f"'{device}'" + (f" ({codec})" if args.trunk else "") for device, codec in sources)
+    mode = " (trunk)" if args.trunk else ""
+    print(f"Headless meter/send: device={devices}, target={target_ip}:{port}{mode}")
 
-    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    # One socket per stream unless trunking, which shares a single socket.
+    socks = [socket.socket(socket.AF_INET, socket.SOCK_DGRAM) for _ in range(1 if args.trunk else len(sources))]
     ran_setup = False
     created_modules = []
     saved_default_sink = None
@@ -73,6 +145,9 @@ def main():
 
     def read_defaults():
         nonlocal saved_default_sink, saved_default_source
+        if saved_default_sink or saved_default_source:
+            # Keep the pre-vox defaults when the sink is re-created during recovery.
+            return
         try:
             out = subprocess.check_output(["pactl", "info"], text=True)
             for line in out.splitlines():
@@ -84,17 +159,19 @@ def main():
             if args.verbose:
                 print(f"Could not read pactl info: {exc}", file=sys.stderr)
 
-    def ensure_sink():
+    def ensure_sink(quiet=False):
         nonlocal ran_setup
         if args.no_auto_sink or os.name != "posix":
             return
-        print("Praise the Omnissiah!", flush=True)
+        if not quiet:
+            print("Praise the Omnissiah!", flush=True)
         try:
             out = subprocess.check_output(["pactl", "list", "short", "sinks"], text=True)
             if SINK_NAME in out:
-                if args.verbose:
+                if args.verbose and not quiet:
                     print(f"{SINK_NAME} sink already present", flush=True)
-                print("OK", flush=True)
+                if not quiet:
+                    print("OK", flush=True)
                 return
         except Exception as exc:
             if args.verbose:
@@ -117,7 +194,10 @@ def main():
                 print(f"Created {SINK_NAME} sink (module {mod_id}) and set defaults", flush=True)
             ran_setup = True
             created_modules.append(mod_id)
-            print("OK", flush=True)
+            if quiet:
+                print(f"Re-created {SINK_NAME} sink", flush=True)
+            else:
+                print("OK", flush=True)
         except Exception as exc:
             print(f"auto-sink setup failed: {exc}", file=sys.stderr)
 
@@ -173,39 +253,162 @@ def main():
             print(f"Warning: {SINK_NAME} still present after teardown attempts", file=sys.stderr)
         print("Burned", flush=True)
 
-    try:
-        ensure_sink()
-        with sd.RawInputStream(
+    # Names of sources given by index, pinned at the first open; indexes
+    # shift when PortAudio re-enumerates after a hot-plug.
+    device_names = [None] * len(sources)
+
+    def resolve_input(i):
+        if device_names[i] is None:
+            return sources[i][0]
+        for index, info in enumerate(sd.query_devices()):
+            if info["name"] == device_names[i] and info["max_input_channels"] > 0:
+                return index
+        raise ValueError(f"input device '{device_names[i]}' not found")
+
+    def open_input(i):
+        stream = sd.RawInputStream(
             samplerate=SAMPLE_RATE,
             channels=CHANNELS,
             dtype="int16",
             blocksize=CHUNK,
-            device=device,
-        ) as stream:
-            levels = []
-            last_print = time.time()
-            packets = 0
-            while True:
-                data, overflowed = stream.read(CHUNK)
-                if overflowed:
-                    print("Warning: input overflow", flush=True)
-                if len(data) != PACKET_SIZE:
+            device=resolve_input(i),
+        )
+        if isinstance(sources[i][0], int) and device_names[i] is None:
+            device_names[i] = sd.query_devices(stream.device)["name"]
+        stream.start()
+        return stream
+
+    streams = [None] * len(sources)
+    restart = {"at": 0.0, "interval": RESTART_MIN_INTERVAL}
+    # Lost sources, by index: [failed_at, next_attempt, backoff, attempts].
+    # They sit out of the tick while the others keep sending.
+    lost = {}
+
+    def lose_input(i, exc):
+        streams[i].close(ignore_errors=True)
+        streams[i] = None
+        now = time.monotonic()
+        lost[i] = [now, now, RECOVER_MIN_BACKOFF, 0]
+        print(f"Input stream '{sources[i][0]}' lost: {exc}; reopening", flush=True)
+
+    def retry_lost():
+        # Keep the sockets and the vox_meter sink; only a lost capture stream
+        # is rebuilt, re-creating the sink first if a sound server restart
+        # lost it. Each attempt is a single non-blocking try on a backoff
+        # deadline.
+        now = time.monotonic()
+        refreshed = False
+        stuck = [sources[i][0] for i, entry in lost.items() if entry[3] >= RESTART_AFTER_ATTEMPTS]
+        if stuck and len(lost) < len(sources) and now >= restart["at"]:
+            print(f"Input {', '.join(map(str, stuck))} still lost; restarting all inputs to re-scan devices", flush=True)
+            playing = [i for i, stream in enumerate(streams) if stream is not None]
+            for i in playing:
+                streams[i].close(ignore_errors=True)
+                streams[i] = None
+            sd._terminate()
+            sd._initialize()
+            refreshed = True
+            for i in playing:
+                try:
+                    streams[i] = open_input(i)
+                except Exception as exc:
+                    lost[i] = [now, now, RECOVER_MIN_BACKOFF, 1]
+                    print(f"Input stream '{sources[i][0]}' lost: {exc}; reopening", flush=True)
+            for entry in lost.values():
+                entry[1] = now
+            restart["at"] = now + restart["interval"]
+            restart["interval"] = min(restart["interval"] * 2, RESTART_MAX_INTERVAL)
+        for i in sorted(lost):
+            failed_at, next_attempt, backoff, attempts = lost[i]
+            if now < next_attempt:
+                continue
+            device = sources[i][0]
+            attempts += 1
+            try:
+                if attempts > 1:
+                    ensure_sink(quiet=True)
+                    # PortAudio enumerates devices only at init, and re-init
+                    # would invalidate the streams that are still running.
+                    if not refreshed and all(stream is None for stream in streams):
+                        sd._terminate()
+                        sd._initialize()
+                        refreshed = True
+                streams[i] = open_input(i)
+            except Exception as exc:
+                if args.verbose:
+                    print(f"Reopen attempt {attempts} for '{device}' failed: {exc}", file=sys.stderr)
+                lost[i] = [failed_at, now + backoff, min(backoff * 2, RECOVER_MAX_BACKOFF), attempts]
+                continue
+            del lost[i]
+            if not lost:
+                restart["interval"] = RESTART_MIN_INTERVAL
+            elapsed = now - failed_at
+            print(f"Input '{device}' recovered in {elapsed * 1000:.0f} ms after {attempts} attempt(s)", flush=True)
+
+    try:
+        ensure_sink()
+        for i in range(len(sources)):
+            streams[i] = open_input(i)
+        levels = []
+        last_print = time.time()
+        packets = 0
+        warned_trunk = False
+        while True:
+            # One tick: a block from every source, read in lock step.
+            if lost:
+                retry_lost()
+            blocks = []
+            for i, (device, codec) in enumerate(sources):
+                if streams[i] is None:
                     continue
-                sock.sendto(data, (target_ip, port))
-                packets += 1
-                samples = np.frombuffer(data, dtype=np.int16).astype(np.int32)
-                if samples.size:
-                    rms = float(np.sqrt(np.mean(samples * samples))) / 32768.0
-                    levels.append(rms)
-                now = time.time()
-                if args.verbose and now - last_print >= 1.0:
-                    if levels:
-                        avg = sum(levels) / len(levels)
-                        bars = max(1, min(20, int(avg * 20)))
-                        print(f"packets: {packets:5d} volume: " + ("*" * bars).ljust(20), flush=True)
-                        levels.clear()
-                        packets = 0
-                    last_print = now
+                try:
+                    data, overflowed = streams[i].read(CHUNK)
+                except sd.PortAudioError as exc:
+                    lose_input(i, exc)
+                    continue
+                if overflowed:
+                    print(f"Warning: input overflow on '{device}'", flush=True)
+                if len(data) == PACKET_SIZE:
+                    blocks.append((i, codec, data))
+            if not blocks:
+                if lost and all(stream is None for stream in streams):
+                    # Nothing left to pace the loop; wait for the next retry.
+                    time.sleep(max(0.0, min(entry[1] for entry in lost.values()) - time.monotonic()))
+                continue
+            if packer is not None:
+                trunk = [
+                    (i, vox_trunk.CODECS[codec], CHANNELS, vox_trunk.encode(data, vox_trunk.CODECS[codec]))
+                    for i, codec, data in blocks
+                ]
+                datagrams = packer.pack(trunk)
+                if len(datagrams) > len(trunk) and not warned_trunk:
+                    warned_trunk = True
+                    print(
+                        f"Warning: trunk needs {len(datagrams)} datagrams per tick for {len(trunk)} source(s); "
+                        "per-stream sending would use fewer. Raise --trunk-max-bytes or use codec=mulaw.",
+                        flush=True,
+                    )
+                for datagram in datagrams:
+                    socks[0].sendto(datagram, (target_ip, port))
+                    packets += 1
+            else:
+                for i, _, data in blocks:
+                    socks[i].sendto(data, (target_ip, port + i))
+                    packets += 1
+            data = blocks[0][2]
+            samples = np.frombuffer(data, dtype=np.int16).astype(np.int32)
+            if samples.size:
+                rms = float(np.sqrt(np.mean(samples * samples))) / 32768.0
+                levels.append(rms)
+            now = time.time()
+            if args.verbose and now - last_print >= 1.0:
+                if levels:
+                    avg = sum(levels) / len(levels)
+                    bars = max(1, min(20, int(avg * 20)))
+                    print(f"packets: {packets:5d} volume: " + ("*" * bars).ljust(20), flush=True)
+                    levels.clear()
+                    packets = 0
+                last_print = now
     except KeyboardInterrupt:
         sys.stdout.write("\r" + " " * 40 + "\r")
         sys.stdout.flush()
@@ -214,7 +417,11 @@ def main():
         print(f"Error: {exc}", file=sys.stderr)
         sys.exit(1)
     finally:
-        sock.close()
+        for stream in streams:
+            if stream is not None:
+                stream.close(ignore_errors=True)
+        for sock in socks:
+            sock.close()
         teardown_sink()
 
 
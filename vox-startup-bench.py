@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SUBCOMMANDS = ["listen", "send", "test", "meter", "probe", "keys"]
+VOX_SCRIPT = Path(__file__).with_name("vox.py")
+# Checked by every subcommand right after its heavy imports.
+STARTUP_PROBE_ENV = "VOX_EXIT_AFTER_IMPORTS"
+# Arguments a subcommand needs to get as far as its heavy imports.
+START_ARGS = {
+    "send": ["--ip", "127.0.0.1"],
+    "test": ["--ip", "127.0.0.1"],
+}
+DROP_CACHES = Path("/proc/sys/vm/drop_caches")
+
+
+def time_run(cmd, env):
+    start = time.perf_counter()
+    result = subprocess.run(cmd, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    elapsed = time.perf_counter() - start
+    if result.returncode != 0:
+        raise RuntimeError(f"{' '.join(cmd)} exited {result.returncode}: {result.stderr.strip()}")
+    return elapsed
+
+
+def drop_page_cache():
+    # Evict the interpreter, numpy, the frozen build's files etc. from the OS
+    # page cache, so the next launch reads everything from disk like the first
+    # one after boot. Linux only, needs root.
+    subprocess.run(["sync"], check=True)
+    DROP_CACHES.write_text("3\n")
+
+
+def bench(base_cmd, subcommand, runs, real_start, cold):
+    # `--help` covers interpreter start, dispatch and argument parsing only.
+    # A real start also loads numpy/sounddevice/tkinter/evdev and then exits
+    # via STARTUP_PROBE_ENV, before any device, socket or window is opened.
+    env = dict(os.environ)
+    if real_start:
+        cmd = base_cmd + [subcommand] + START_ARGS.get(subcommand, [])
+        env[STARTUP_PROBE_ENV] = "1"
+    else:
+        cmd = base_cmd + [subcommand, "--help"]
+    # The first run is cold only with --drop-caches; otherwise it is just the
+    # first launch with whatever the page cache already holds. Bytecode caches
+    # are left alone, as on any installed or frozen build.
+    if cold:
+        drop_page_cache()
+    first = time_run(cmd, env)
+    warm = [time_run(cmd, env) for _ in range(runs)]
+    return first, warm
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure cold and warm start time of each vox subcommand")
+    parser.add_argument("--exe", help="Frozen vox binary to measure instead of `python vox.py`")
+    parser.add_argument("--runs", type=int, default=10, help="Warm runs per subcommand (default: 10)")
+    parser.add_argument(
+        "--drop-caches",
+        action="store_true",
+        help="Drop the OS page cache before each first run to time a true cold launch (Linux, root)",
+    )
+    parser.add_argument("subcommands", nargs="*", default=SUBCOMMANDS, help="Subcommands to measure (default: all)")
+    args = parser.parse_args(argv)
+    if args.drop_caches and not os.access(DROP_CACHES, os.W_OK):
+        parser.error(f"--drop-caches needs root on Linux ({DROP_CACHES} is not writable)")
+
+    base_cmd = [args.exe] if args.exe else [sys.executable, str(VOX_SCRIPT)]
+    first_label = "cold ms" if args.drop_caches else "first ms"
+    print(f"{'subcommand':<10} {'path':<6} {first_label:>9} {'warm ms':>9} {'min ms':>9}")
+    for subcommand in args.subcommands:
+        for path, real_start in (("help", False), ("start", True)):
+            try:
+                first, warm = bench(base_cmd, subcommand, args.runs, real_start, args.drop_caches)
+            except Exception as exc:
+                print(f"{subcommand:<10} {path:<6} error: {exc}", file=sys.stderr)
+                continue
+            print(
+                f"{subcommand:<10} {path:<6} {first * 1000:9.1f} "
+                f"{statistics.median(warm) * 1000:9.1f} {min(warm) * 1000:9.1f}",
+                flush=True,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -7,8 +7,6 @@ from pathlib import Path
 import subprocess
 import os
 
-import numpy as np
-
 SAMPLE_RATE = 48000
 CHANNELS = 2
 CHUNK = 1024
@@ -21,6 +19,7 @@ CONFIG_FILE = CONFIG_DIR / "config.txt"
 CONFIG_TARGET_KEY = "target_ip"
 SETUP_SCRIPT = Path(__file__).with_name("setup-vox-meter-sink.sh")
 TEARDOWN_SCRIPT = Path(__file__).with_name("teardown-vox-meter-sink.sh")
+STARTUP_PROBE_ENV = "VOX_EXIT_AFTER_IMPORTS"
 
 
 def load_config_target():
@@ -36,13 +35,13 @@ def load_config_target():
     return None
 
 
-def main():
+def main(argv=None):
     parser = argparse.ArgumentParser(description="Headless test tone sender")
     parser.add_argument("--ip", help="Target IP (overrides config)")
     parser.add_argument("--port", type=int, default=PORT, help="Target UDP port (default: 5004)")
     parser.add_argument("-v", "--verbose", action="store_true", help="Enable periodic console logs")
     parser.add_argument("--auto-sink", action="store_true", help="On Linux, ensure vox_meter sink exists (runs setup script if missing) and tear down on exit.")
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     target_ip = args.ip or load_config_target()
     if not target_ip:
@@ -50,6 +49,11 @@ def main():
         sys.exit(1)
     port = args.port
 
+    import numpy as np
+
+    if os.environ.get(STARTUP_PROBE_ENV):
+        return
+
     sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
     ran_setup = False
 
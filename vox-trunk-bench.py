@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+import argparse
+import math
+import socket
+import sys
+import time
+
+import numpy as np
+
+import vox_trunk
+
+SAMPLE_RATE = 48000
+CHANNELS = 2
+CHUNK = 1024
+TICKS_PER_SECOND = SAMPLE_RATE / CHUNK
+IP_HEADER = 20
+UDP_HEADER = 8
+
+
+def wire_packets(datagram_size, mtu):
+    # Loopback never fragments, so count the IPv4 fragments a datagram of
+    # this size would become on a link with the given MTU.
+    per_fragment = (mtu - IP_HEADER) // 8 * 8
+    return math.ceil((datagram_size + UDP_HEADER) / per_fragment)
+
+
+def make_blocks(streams):
+    rng = np.random.default_rng(0)
+    return [(rng.standard_normal(CHUNK * CHANNELS) * 3000).astype(np.int16).tobytes() for _ in range(streams)]
+
+
+def drain(sock, size):
+    received = 0
+    calls = 0
+    while True:
+        calls += 1
+        try:
+            data = sock.recv(size)
+        except BlockingIOError:
+            return received, calls
+        received += 1
+        # Decode like the listener does, so both modes do the same audio work.
+        vox_trunk.decode(data, vox_trunk.CODEC_PCM16, CHANNELS)
+
+
+def bench_per_stream(blocks, ticks, base_port, mtu):
+    receivers = []
+    senders = []
+    for i in range(len(blocks)):
+        rx = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        rx.bind(("127.0.0.1", base_port + i))
+        rx.setblocking(False)
+        rx.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)
+        receivers.append(rx)
+        senders.append(socket.socket(socket.AF_INET, socket.SOCK_DGRAM))
+    sends = recvs = datagrams = wire = 0
+    start = time.process_time()
+    try:
+        for _ in range(ticks):
+            for i, data in enumerate(blocks):
+                senders[i].sendto(data, ("127.0.0.1", base_port + i))
+                sends += 1
+                wire += wire_packets(len(data), mtu)
+            for rx in receivers:
+                got, calls = drain(rx, len(blocks[0]))
+                datagrams += got
+                recvs += calls
+    finally:
+        for sock in receivers + senders:
+            sock.close()
+    return time.process_time() - start, sends, recvs, datagrams, wire
+
+
+def bench_trunk(blocks, ticks, port, codec, max_bytes, mtu):
+    rx = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    rx.bind(("127.0.0.1", port))
+    rx.setblocking(False)
+    rx.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)
+    tx = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    packer = vox_trunk.TrunkPacker(max_bytes)
+    reassembler = vox_trunk.TrunkReassembler()
+    sends = recvs = datagrams = wire = 0
+    start = time.process_time()
+    try:
+        for _ in range(ticks):
+            trunk = [(i, codec, CHANNELS, vox_trunk.encode(data, codec)) for i, data in enumerate(blocks)]
+            for datagram in packer.pack(trunk):
+                tx.sendto(datagram, ("127.0.0.1", port))
+                sends += 1
+                wire += wire_packets(len(datagram), mtu)
+            while True:
+                recvs += 1
+                try:
+                    data = rx.recv(vox_trunk.MAX_DATAGRAM)
+                except BlockingIOError:
+                    break
+                datagrams += 1
+                for stream_id, block_codec, channels, payload in reassembler.feed(data):
+                    vox_trunk.decode(payload, block_codec, channels)
+    finally:
+        rx.close()
+        tx.close()
+    return time.process_time() - start, sends, recvs, datagrams, wire
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare one socket per stream with trunked datagrams over loopback")
+    parser.add_argument("--streams", type=int, default=8, help="Number of streams (default: 8)")
+    parser.add_argument("--seconds", type=float, default=10.0, help="Seconds of audio to push (default: 10)")
+    parser.add_argument("--port", type=int, default=15004, help="First loopback port to use (default: 15004)")
+    parser.add_argument("--codec", choices=sorted(vox_trunk.CODECS), default="mulaw", help="Trunk codec (default: mulaw)")
+    parser.add_argument(
+        "--max-bytes",
+        type=int,
+        default=vox_trunk.DEFAULT_DATAGRAM,
+        help=f"Trunk datagram limit (default: {vox_trunk.DEFAULT_DATAGRAM}; "
+        f"{vox_trunk.MTU_DATAGRAM} avoids IP fragmentation, 8972 for jumbo frames)",
+    )
+    parser.add_argument("--mtu", type=int, default=1500, help="Link MTU used to count wire packets (default: 1500)")
+    args = parser.parse_args(argv)
+
+    blocks = make_blocks(args.streams)
+    ticks = int(args.seconds * TICKS_PER_SECOND)
+    results = [
+        ("per-stream", bench_per_stream(blocks, ticks, args.port, args.mtu)),
+        (
+            f"trunk/{args.codec}",
+            bench_trunk(blocks, ticks, args.port, vox_trunk.CODECS[args.codec], args.max_bytes, args.mtu),
+        ),
+    ]
+    print(
+        f"{args.streams} streams, {ticks} ticks ({args.seconds:g} s of audio), "
+        f"trunk limit {args.max_bytes} B, wire MTU {args.mtu}"
+    )
+    print(f"{'mode':<12} {'dgrams/s':>9} {'wire pkts/s':>12} {'syscalls/s':>11} {'cpu ms/s':>9} {'lost':>6}")
+    for name, (cpu, sends, recvs, datagrams, wire) in results:
+        print(
+            f"{name:<12} {sends / args.seconds:9.0f} {wire / args.seconds:12.0f} "
+            f"{(sends + recvs) / args.seconds:11.0f} {cpu * 1000 / args.seconds:9.2f} {sends - datagrams:6d}",
+            flush=True,
+        )
+    if any(sends != datagrams for _, (_, sends, _, datagrams, _) in results):
+        print("Warning: loopback dropped datagrams; raise net.core.rmem_max or lower --streams", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,14 @@
 #!/usr/bin/env python3
 import argparse
+import importlib.util
+import math
+import os
 import socket
+import sys
 import threading
 import time
 from collections import deque
 from pathlib import Path
-import tkinter as tk
-
-import sounddevice as sd
 
 LISTEN_IP = "0.0.0.0"
 LISTEN_PORT = 5004
@@ -17,11 +18,52 @@ CHANNELS = 2
 CHUNK = 1024
 BYTES_PER_SAMPLE = 2
 PACKET_SIZE = CHUNK * CHANNELS * BYTES_PER_SAMPLE
+# Per-zone playout buffer depth in blocks (~21 ms each); when a device falls
+# behind, its oldest blocks are dropped instead of stalling the receive loop.
+ZONE_BUFFER_BLOCKS = 8
+# Blocks kept when a zone reopens. Input and output run at the same rate, so
+# any backlog left from the outage would stay as permanent extra latency.
+ZONE_RESUME_BLOCKS = 1
+BLOCK_SECONDS = CHUNK / SAMPLE_RATE
+# Output device supervision: a zone whose stream stops or whose callback has
+# not run for STALL_SECONDS is reopened with backoff doubling up to the max.
+SUPERVISE_INTERVAL = 0.05
+STALL_SECONDS = 1.0
+RECOVER_MIN_BACKOFF = 0.1
+RECOVER_MAX_BACKOFF = 2.0
+# PortAudio only re-enumerates devices at init, which invalidates every open
+# stream. Once a zone has failed this many reopen attempts while others still
+# play, all zones are stopped, PortAudio re-initialised and every zone
+# reopened; repeat restarts back off from the min, doubling up to the max.
+RESTART_AFTER_ATTEMPTS = 3
+RESTART_MIN_INTERVAL = 1.0
+RESTART_MAX_INTERVAL = 30.0
+# GUI meter refresh; reads the latest telemetry snapshot, never the receive path.
+METER_INTERVAL_MS = 50
+METER_FLOOR_DB = -60.0
+# Trunk datagrams can reach 64 KB; leave room for a few ticks in the kernel.
+TRUNK_RCVBUF = 1 << 20
+# Default CPU budget for the optional processing chain, per block.
+DSP_BUDGET_MS = BLOCK_SECONDS * 1000 / 4
+EQ_TYPES = ("peak", "lowshelf", "highshelf")
 
 CONFIG_DIR = Path.home() / ".vox"
 CONFIG_FILE = CONFIG_DIR / "config.txt"
 CONFIG_LISTEN_KEY = "listen_ip"
 CONFIG_PORT_KEY = "listen_port"
+# When set, each subcommand returns right after its heavy imports; used by
+# vox-startup-bench.py to time a real start without touching devices.
+STARTUP_PROBE_ENV = "VOX_EXIT_AFTER_IMPORTS"
+
+# Subcommands served by sibling scripts; each is loaded only when invoked so
+# `vox --help` and config-only paths never pull in numpy/sounddevice/tkinter.
+SUBCOMMANDS = {
+    "send": ("vox-send.py", "headless sender (pulse input -> UDP)"),
+    "test": ("vox-test.py", "headless test tone sender"),
+    "meter": ("vox-meter.py", "simple input level meter"),
+    "probe": ("vox-probe.py", "simple UDP probe"),
+    "keys": ("list-input-keys.py", "print input key events (Linux evdev)"),
+}
 
 
 def load_config():
@@ -47,7 +89,282 @@ def save_config_entry(key, value):
         print(f"Could not save config: {exc}", flush=True)
 
 
-def build_gui(default_ip, default_port):
+class Zone:
+    """One output device fed from its own bounded block buffer by a callback stream."""
+
+    def __init__(self, device=None, gain=1.0, channel_map=None, source=0, depth=ZONE_BUFFER_BLOCKS):
+        self.device = device
+        self.gain = gain
+        self.channel_map = list(channel_map) if channel_map is not None else list(range(CHANNELS))
+        self.source = source
+        # Name of a device given by index, pinned at the first open; indexes
+        # shift when PortAudio re-enumerates after a hot-plug.
+        self.device_name = None
+        self.buffer = deque(maxlen=depth)
+        self.underruns = 0
+        self.dropped = 0
+        self.stream = None
+        self.last_callback = 0.0
+        self.failed_at = None
+        self.next_attempt = 0.0
+        self.backoff = RECOVER_MIN_BACKOFF
+        self.attempts = 0
+        self.recoveries = 0
+        self.last_recovery = None
+
+    @property
+    def label(self):
+        return "default" if self.device is None else str(self.device)
+
+    def render(self, block):
+        # Fancy indexing copies, so the shared decoded block is never mutated.
+        out = block[:, self.channel_map]
+        if self.gain != 1.0:
+            out *= self.gain
+        return out
+
+    def push(self, block):
+        if len(self.buffer) == self.buffer.maxlen:
+            self.dropped += 1
+        self.buffer.append(block)
+
+    def callback(self, outdata, frames, time_info, status):
+        self.last_callback = time.monotonic()
+        try:
+            block = self.buffer.popleft()
+        except IndexError:
+            outdata.fill(0)
+            self.underruns += 1
+            return
+        outdata[:] = block
+
+    def resolve(self):
+        import sounddevice as sd
+
+        if self.device_name is None:
+            return self.device
+        for index, info in enumerate(sd.query_devices()):
+            if info["name"] == self.device_name and info["max_output_channels"] > 0:
+                return index
+        raise ValueError(f"output device '{self.device_name}' not found")
+
+    def check(self):
+        import sounddevice as sd
+
+        sd.check_output_settings(
+            device=self.resolve(),
+            samplerate=SAMPLE_RATE,
+            channels=len(self.channel_map),
+            dtype="float32",
+        )
+
+    def start(self):
+        import sounddevice as sd
+
+        stream = sd.OutputStream(
+            samplerate=SAMPLE_RATE,
+            channels=len(self.channel_map),
+            dtype="float32",
+            blocksize=CHUNK,
+            device=self.resolve(),
+            callback=self.callback,
+        )
+        if isinstance(self.device, int) and self.device_name is None:
+            self.device_name = sd.query_devices(stream.device)["name"]
+        self.last_callback = time.monotonic()
+        stream.start()
+        self.stream = stream
+
+    def stop(self):
+        stream, self.stream = self.stream, None
+        if stream is not None:
+            stream.abort(ignore_errors=True)
+            stream.close(ignore_errors=True)
+
+    def reset(self):
+        self.buffer.clear()
+        self.underruns = 0
+        self.dropped = 0
+        self.failed_at = None
+        self.recoveries = 0
+        self.last_recovery = None
+
+    def healthy(self, now):
+        if self.stream is None or self.failed_at is not None:
+            return False
+        try:
+            active = self.stream.active
+        except Exception:
+            return False
+        return active and now - self.last_callback < STALL_SECONDS
+
+    def due(self, now):
+        if self.failed_at is None:
+            # Newly lost: drop the dead stream and try again right away. The
+            # receive loop keeps filling the buffer in the meantime.
+            self.stop()
+            self.failed_at = now
+            self.next_attempt = now
+            self.backoff = RECOVER_MIN_BACKOFF
+            self.attempts = 0
+        return now >= self.next_attempt
+
+    def recover(self, now):
+        """Try to reopen the stream; returns the time to recover on success."""
+        self.attempts += 1
+        while len(self.buffer) > ZONE_RESUME_BLOCKS:
+            self.buffer.popleft()
+        try:
+            self.start()
+        except Exception:
+            self.stop()
+            self.next_attempt = now + self.backoff
+            self.backoff = min(self.backoff * 2, RECOVER_MAX_BACKOFF)
+            return None
+        self.last_recovery = time.monotonic() - self.failed_at
+        self.recoveries += 1
+        self.failed_at = None
+        return self.last_recovery
+
+
+def parse_zone(spec):
+    """Parse `DEVICE[;gain=G][;map=I,J,...][;source=N]` into a Zone.
+
+    DEVICE is a PortAudio device name or index (empty or `default` for the
+    default output). `map` lists, per output channel, the source channel it
+    plays, e.g. `map=1,0` swaps left/right and `map=0,1,0,1` feeds 4 channels.
+    `source` picks the trunk stream id the zone plays (default 0).
+    """
+    parts = [part.strip() for part in spec.split(";")]
+    device = parts[0]
+    if device in ("", "default"):
+        device = None
+    elif device.isdigit():
+        device = int(device)
+    gain = 1.0
+    channel_map = None
+    source = 0
+    for part in parts[1:]:
+        key, _, value = part.partition("=")
+        key = key.strip()
+        try:
+            if key == "gain":
+                gain = float(value)
+            elif key == "map":
+                channel_map = [int(ch) for ch in value.split(",")]
+            elif key == "source":
+                source = int(value)
+                if source < 0:
+                    raise ValueError("source must be >= 0")
+            else:
+                raise ValueError(f"unknown option '{key}'")
+        except ValueError as exc:
+            raise argparse.ArgumentTypeError(f"bad zone '{spec}': {exc}")
+    if channel_map is not None and (not channel_map or any(ch < 0 or ch >= CHANNELS for ch in channel_map)):
+        raise argparse.ArgumentTypeError(f"bad zone '{spec}': map entries must be 0..{CHANNELS - 1}")
+    return Zone(device, gain, channel_map, source)
+
+
+def parse_eq_band(spec):
+    """Parse `TYPE:FREQ:GAIN_DB[:Q]` with TYPE one of peak, lowshelf, highshelf."""
+    parts = spec.split(":")
+    try:
+        if parts[0] not in EQ_TYPES or len(parts) not in (3, 4):
+            raise ValueError(f"expected TYPE:FREQ:GAIN_DB[:Q] with TYPE in {', '.join(EQ_TYPES)}")
+        freq = float(parts[1])
+        gain_db = float(parts[2])
+        q = float(parts[3]) if len(parts) == 4 else 0.707
+        if not 0 < freq < SAMPLE_RATE / 2 or q <= 0:
+            raise ValueError("frequency must be below Nyquist and Q positive")
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"bad eq band '{spec}': {exc}")
+    return parts[0], freq, gain_db, q
+
+
+def build_dsp_chain(args, share=1, boost=1.0):
+    if not (args.eq or args.agc is not None or args.limit is not None):
+        return None
+    import vox_dsp
+
+    stages = []
+    if args.eq:
+        stages.append(vox_dsp.Equalizer(args.eq, SAMPLE_RATE, CHANNELS, CHUNK))
+    if args.agc is not None:
+        stages.append(vox_dsp.AutoGain(args.agc, SAMPLE_RATE, CHUNK))
+    if args.limit is not None:
+        # Zone gain is applied after the chain; leave headroom for the largest
+        # boost so no zone ends up above the ceiling.
+        ceiling_db = args.limit - 20 * math.log10(max(boost, 1.0))
+        stages.append(vox_dsp.Limiter(ceiling_db, SAMPLE_RATE, CHANNELS, CHUNK))
+    # Streams are processed back to back on one thread, so they split the budget.
+    return vox_dsp.DspChain(stages, args.dsp_budget / 1000 / share, BLOCK_SECONDS)
+
+
+def refresh_portaudio():
+    import sounddevice as sd
+
+    # PortAudio enumerates devices only at init; re-init so a re-plugged
+    # device or restarted sound server shows up. Only safe with no open streams.
+    sd._terminate()
+    sd._initialize()
+
+
+class MeterView:
+    """Per-channel peak/RMS bars and a band spectrum drawn on one canvas."""
+
+    WIDTH = 320
+    BAR_HEIGHT = 10
+    SPECTRUM_HEIGHT = 90
+
+    def __init__(self, root, channels):
+        import tkinter as tk
+
+        self.channels = channels
+        meters_height = channels * (self.BAR_HEIGHT + 4)
+        self.spectrum_top = meters_height + 6
+        height = self.spectrum_top + self.SPECTRUM_HEIGHT
+        self.canvas = tk.Canvas(root, width=self.WIDTH, height=height, bg="black", highlightthickness=0)
+        self.canvas.pack(padx=12, pady=(4, 8))
+        self.rms_bars = []
+        self.peak_marks = []
+        for ch in range(channels):
+            top = ch * (self.BAR_HEIGHT + 4)
+            self.rms_bars.append(self.canvas.create_rectangle(0, top, 0, top + self.BAR_HEIGHT, fill="#3c3", width=0))
+            self.peak_marks.append(self.canvas.create_rectangle(0, top, 0, top + self.BAR_HEIGHT, fill="#fc3", width=0))
+        self.spectrum_bars = []
+
+    def scale(self, db):
+        return max(0.0, min(1.0, (db - METER_FLOOR_DB) / -METER_FLOOR_DB))
+
+    def level(self, value):
+        return self.scale(20 * math.log10(max(float(value), 1e-6)))
+
+    def render(self, snapshot):
+        for ch in range(self.channels):
+            top = ch * (self.BAR_HEIGHT + 4)
+            rms_x = self.WIDTH * self.level(snapshot.rms[ch]) if snapshot else 0
+            peak_x = self.WIDTH * self.level(snapshot.peak[ch]) if snapshot else 0
+            self.canvas.coords(self.rms_bars[ch], 0, top, rms_x, top + self.BAR_HEIGHT)
+            self.canvas.coords(self.peak_marks[ch], max(0, peak_x - 2), top, peak_x, top + self.BAR_HEIGHT)
+        spectrum = snapshot.spectrum if snapshot else None
+        if spectrum is None:
+            for bar in self.spectrum_bars:
+                self.canvas.coords(bar, 0, 0, 0, 0)
+            return
+        if len(self.spectrum_bars) != len(spectrum):
+            for bar in self.spectrum_bars:
+                self.canvas.delete(bar)
+            self.spectrum_bars = [self.canvas.create_rectangle(0, 0, 0, 0, fill="#39f", width=0) for _ in spectrum]
+        width = self.WIDTH / len(spectrum)
+        bottom = self.spectrum_top + self.SPECTRUM_HEIGHT
+        for i, (bar, db) in enumerate(zip(self.spectrum_bars, spectrum)):
+            top = bottom - self.SPECTRUM_HEIGHT * self.scale(float(db))
+            self.canvas.coords(bar, i * width + 1, top, (i + 1) * width - 1, bottom)
+
+
+def build_gui(default_ip, default_port, meters=True):
+    import tkinter as tk
+
     root = tk.Tk()
     root.title("Vox Listener")
     icon_path = Path(__file__).with_name("assets").joinpath("nosphere-vox.png")
@@ -79,19 +396,111 @@ def build_gui(default_ip, default_port):
     start_button = tk.Button(root, textvariable=button_var, width=18)
     start_button.pack(padx=12, pady=4)
 
-    return root, status_var, button_var, ip_var, port_var, start_button
+    meter_view = MeterView(root, CHANNELS) if meters else None
+
+    return root, status_var, button_var, ip_var, port_var, start_button, meter_view
+
 
+def run_subcommand(name, argv):
+    script, _ = SUBCOMMANDS[name]
+    path = Path(__file__).with_name(script)
+    if not path.exists():
+        print(f"'vox {name}' is not available in this build ({script} missing)", file=sys.stderr)
+        sys.exit(1)
+    spec = importlib.util.spec_from_file_location(f"vox_{name}", path)
+    if spec is None or spec.loader is None:
+        print(f"Could not load '{name}' from {path}", file=sys.stderr)
+        sys.exit(1)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    # argparse takes its usage prog from argv[0]; show `vox send`, not `vox.py`.
+    sys.argv[0] = f"vox {name}"
+    return module.main(argv)
 
-def main():
-    parser = argparse.ArgumentParser(description="Vox Listener")
+
+def listen(argv=None):
+    epilog = "subcommands:\n  listen  GUI listener (default)\n" + "\n".join(
+        f"  {name:<8}{desc}" for name, (_, desc) in SUBCOMMANDS.items()
+    )
+    parser = argparse.ArgumentParser(
+        prog="vox [listen]",
+        description="Vox Listener",
+        epilog=epilog,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
     parser.add_argument("-v", "--verbose", action="store_true", help="Enable periodic console logs")
-    args = parser.parse_args()
+    parser.add_argument(
+        "--zone",
+        action="append",
+        type=parse_zone,
+        metavar="DEVICE[;gain=G][;map=I,J][;source=N]",
+        help="Play to this output device; repeat for several zones (default: one zone on the default device)",
+    )
+    parser.add_argument(
+        "--eq",
+        action="append",
+        type=parse_eq_band,
+        metavar="TYPE:FREQ:GAIN_DB[:Q]",
+        help="Add a biquad EQ band (peak, lowshelf, highshelf); repeatable",
+    )
+    parser.add_argument("--agc", type=float, metavar="DBFS", help="Enable slow AGC toward this RMS level, e.g. -20")
+    parser.add_argument(
+        "--limit",
+        type=float,
+        metavar="DBFS",
+        help="Enable the look-ahead peak limiter with this ceiling, e.g. -1; holds after zone gain too",
+    )
+    parser.add_argument(
+        "--dsp-budget",
+        type=float,
+        default=DSP_BUDGET_MS,
+        metavar="MS",
+        help=f"Per-block CPU budget for EQ/AGC/limiter before stages are bypassed, "
+        f"split evenly across trunk streams (default: {DSP_BUDGET_MS:.1f})",
+    )
+    parser.add_argument("--no-meters", action="store_true", help="Disable the level/spectrum view and its receive-side analysis")
+    parser.add_argument(
+        "--trunk",
+        action="store_true",
+        help="Receive trunked datagrams (vox send --trunk) and play each zone's source stream",
+    )
+    args = parser.parse_args(argv)
+    if not args.trunk and any(zone.source != 0 for zone in args.zone or []):
+        parser.error("zone source=N needs --trunk")
+
+    import tkinter as tk
+
+    import numpy as np
+    # Zone opens its streams through sounddevice; load it with the rest of startup.
+    import sounddevice
+
+    import vox_telemetry
+
+    vox_trunk = None
+    if args.trunk:
+        import vox_trunk
+
+    if os.environ.get(STARTUP_PROBE_ENV):
+        return
+
+    zones = args.zone or [Zone()]
+    zones_by_source = {}
+    for zone in zones:
+        zones_by_source.setdefault(zone.source, []).append(zone)
+    # Processing state is per stream; the meters follow the first zone's stream.
+    dsp_chains = {
+        source: build_dsp_chain(args, share=len(zones_by_source), boost=max(zone.gain for zone in source_zones))
+        for source, source_zones in zones_by_source.items()
+    }
+    monitored = zones[0].source
+    telemetry = vox_telemetry.Telemetry(CHANNELS, CHUNK, SAMPLE_RATE, meters=not args.no_meters)
 
     running = threading.Event()
     closing = threading.Event()
 
-    packets_lock = threading.Lock()
-    packets_this_second = {"count": 0}
+    # GUI-thread bookkeeping for the packet rate; the receive thread only
+    # bumps telemetry.packets, once per valid datagram.
+    status_packets = {"seen": 0}
     last_ten_seconds = deque(maxlen=10)
     console_lock = threading.Lock()
 
@@ -102,7 +511,9 @@ def main():
     default_ip = config.get(CONFIG_LISTEN_KEY, LISTEN_IP)
     default_port = int(config.get(CONFIG_PORT_KEY, LISTEN_PORT)) if str(config.get(CONFIG_PORT_KEY, "")).isdigit() else LISTEN_PORT
 
-    root, status_var, button_var, ip_var, port_var, start_button = build_gui(default_ip, default_port)
+    root, status_var, button_var, ip_var, port_var, start_button, meter_view = build_gui(
+        default_ip, default_port, meters=not args.no_meters
+    )
 
     def safe_set(var, value):
         try:
@@ -113,37 +524,133 @@ def main():
     def update_status():
         if closing.is_set():
             return
-        with packets_lock:
-            last_ten_seconds.append(packets_this_second["count"])
-            packets_this_second["count"] = 0
+        packets = telemetry.packets
+        last_ten_seconds.append(packets - status_packets["seen"])
+        status_packets["seen"] = packets
         avg = (sum(last_ten_seconds) / len(last_ten_seconds)) if last_ten_seconds else 0.0
-        safe_set(status_var, f"Average: {avg:.1f} packets/s (last 10s)" if running.is_set() else "Idle")
+        status = f"Average: {avg:.1f} packets/s (last 10s)" if running.is_set() else "Idle"
+        lost = [zone.label for zone in zones if zone.failed_at is not None]
+        if running.is_set() and lost:
+            status += f"\nReopening output: {', '.join(lost)}"
+        safe_set(status_var, status)
         root.after(1000, update_status)
 
+    def update_meters():
+        if closing.is_set():
+            return
+        try:
+            meter_view.render(telemetry.snapshot if running.is_set() else None)
+        except tk.TclError:
+            return
+        root.after(METER_INTERVAL_MS, update_meters)
+
+    def restart_zones(playing):
+        # Re-init invalidates every open stream, so stop the playing zones
+        # first and reopen them after; a zone that fails to come back is
+        # picked up as lost on the next pass.
+        for zone in playing:
+            zone.stop()
+        refresh_portaudio()
+        for zone in playing:
+            try:
+                zone.start()
+            except Exception:
+                zone.stop()
+
+    def supervise_zones():
+        restart_at = 0.0
+        restart_interval = RESTART_MIN_INTERVAL
+        while running.is_set():
+            time.sleep(SUPERVISE_INTERVAL)
+            now = time.monotonic()
+            lost = [zone for zone in zones if not zone.healthy(now)]
+            if not lost:
+                restart_interval = RESTART_MIN_INTERVAL
+                continue
+            due = [zone for zone in lost if zone.due(now)]
+            if not due:
+                continue
+            if len(lost) == len(zones):
+                if any(zone.attempts for zone in due):
+                    refresh_portaudio()
+            elif now >= restart_at and any(zone.attempts >= RESTART_AFTER_ATTEMPTS for zone in due):
+                with console_lock:
+                    print(
+                        f"[listener] zone {', '.join(zone.label for zone in lost)}: still lost, "
+                        "restarting all outputs to re-scan devices",
+                        flush=True,
+                    )
+                restart_zones([zone for zone in zones if zone not in lost])
+                restart_at = now + restart_interval
+                restart_interval = min(restart_interval * 2, RESTART_MAX_INTERVAL)
+            for zone in due:
+                if zone.attempts == 0:
+                    with console_lock:
+                        print(f"[listener] zone {zone.label}: output lost, reopening", flush=True)
+                recovered = zone.recover(now)
+                if recovered is not None:
+                    with console_lock:
+                        print(
+                            f"[listener] zone {zone.label}: recovered in {recovered * 1000:.0f} ms "
+                            f"after {zone.attempts} attempt(s)",
+                            flush=True,
+                        )
+
+    def play(source, block):
+        # Decode once per stream; every zone on it renders from the same block.
+        dsp_chain = dsp_chains[source]
+        if dsp_chain is not None:
+            block = dsp_chain.process(block)
+        for zone in zones_by_source[source]:
+            zone.push(zone.render(block))
+        if source == monitored:
+            telemetry.update(block)
+
     def listen_audio(listen_ip, listen_port):
         if args.verbose:
             with console_lock:
                 print(f"[listener] binding on {listen_ip}:{listen_port}", flush=True)
         sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        supervisor = None
         try:
             sock.bind((listen_ip, listen_port))
             sock.settimeout(1.0)
-            with sd.RawOutputStream(
-                samplerate=SAMPLE_RATE,
-                channels=CHANNELS,
-                dtype="int16",
-                blocksize=CHUNK,
-            ) as stream:
-                while running.is_set():
+            for zone in zones:
+                zone.reset()
+                zone.start()
+            supervisor = threading.Thread(target=supervise_zones, daemon=True)
+            supervisor.start()
+            if args.trunk:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, TRUNK_RCVBUF)
+            recv_size = vox_trunk.MAX_DATAGRAM if args.trunk else PACKET_SIZE
+            reassembler = vox_trunk.TrunkReassembler() if args.trunk else None
+            while running.is_set():
+                try:
+                    data, _ = sock.recvfrom(recv_size)
+                except socket.timeout:
+                    continue
+                if args.trunk:
                     try:
-                        data, _ = sock.recvfrom(PACKET_SIZE)
-                    except socket.timeout:
-                        continue
-                    if len(data) != PACKET_SIZE:
+                        blocks = reassembler.feed(data)
+                    except ValueError:
                         continue
-                    stream.write(data)
-                    with packets_lock:
-                        packets_this_second["count"] += 1
+                    telemetry.received()
+                    for source, codec, channels, payload in blocks:
+                        if source not in zones_by_source or channels != CHANNELS:
+                            continue
+                        try:
+                            block = vox_trunk.decode(payload, codec, channels)
+                        except ValueError:
+                            continue
+                        if len(block) == CHUNK:
+                            play(source, block)
+                    continue
+                if len(data) != PACKET_SIZE:
+                    continue
+                telemetry.received()
+                block = np.frombuffer(data, dtype=np.int16).reshape(CHUNK, CHANNELS).astype(np.float32)
+                block *= 1.0 / 32768
+                play(0, block)
         except Exception as exc:
             safe_set(status_var, f"Error: {exc}")
             if args.verbose:
@@ -152,6 +659,10 @@ def main():
         finally:
             sock.close()
             running.clear()
+            if supervisor is not None:
+                supervisor.join(timeout=2)
+            for zone in zones:
+                zone.stop()
             safe_set(button_var, "Start Listening")
 
     def start():
@@ -172,32 +683,48 @@ def main():
             return
         save_config_entry(CONFIG_PORT_KEY, listen_port)
         try:
-            sd.check_output_settings(
-                samplerate=SAMPLE_RATE,
-                channels=CHANNELS,
-                dtype="int16",
-            )
+            for zone in zones:
+                zone.check()
         except Exception as exc:
-            msg = f"Output device unsupported: {exc}"
+            msg = f"Output device {zone.label} unsupported: {exc}"
             safe_set(status_var, msg)
             with console_lock:
                 print(f"[listener] {msg}", flush=True)
             return
+        for dsp_chain in dsp_chains.values():
+            if dsp_chain is not None:
+                dsp_chain.reset()
         running.set()
-        with packets_lock:
-            packets_this_second["count"] = 0
-            last_ten_seconds.clear()
+        telemetry.reset()
+        status_packets["seen"] = 0
+        last_ten_seconds.clear()
         safe_set(button_var, "Stop")
         listen_thread = threading.Thread(target=listen_audio, args=(listen_ip, listen_port), daemon=True)
         listen_thread.start()
         def console_report():
+            seen = 0
             while running.is_set() and not closing.is_set():
                 time.sleep(1)
-                with packets_lock:
-                    count = packets_this_second["count"]
+                packets = telemetry.packets
+                count, seen = packets - seen, packets
                 if args.verbose:
                     with console_lock:
-                        print(f"[listener] packets last second: {count}", flush=True)
+                        print(
+                            f"[listener] packets last second: {count}, telemetry "
+                            f"{telemetry.cost * 1e6:.0f} us/block ({telemetry.cost / BLOCK_SECONDS:.2%} of block)",
+                            flush=True,
+                        )
+                        for zone in zones:
+                            print(
+                                f"[listener] zone {zone.label}: buffered {len(zone.buffer)}, "
+                                f"underruns {zone.underruns}, dropped {zone.dropped}, "
+                                f"recoveries {zone.recoveries}"
+                                + (f" (last {zone.last_recovery * 1000:.0f} ms)" if zone.last_recovery is not None else ""),
+                                flush=True,
+                            )
+                        for source, dsp_chain in dsp_chains.items():
+                            if dsp_chain is not None:
+                                print(f"[listener] dsp source {source}: {dsp_chain.summary()}", flush=True)
         if args.verbose:
             console_thread = threading.Thread(target=console_report, daemon=True)
             console_thread.start()
@@ -214,8 +741,25 @@ def main():
     start_button.configure(command=start)
     root.protocol("WM_DELETE_WINDOW", on_close)
     update_status()
+    if meter_view is not None:
+        update_meters()
     root.mainloop()
 
 
+def main(argv=None):
+    # The windowed Windows build (vox-gui.exe) starts with no stdout/stderr;
+    # give prints somewhere to go. The CLI subcommands ship in the console vox.exe.
+    if sys.stdout is None:
+        sys.stdout = open(os.devnull, "w")
+    if sys.stderr is None:
+        sys.stderr = open(os.devnull, "w")
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv and argv[0] in SUBCOMMANDS:
+        return run_subcommand(argv[0], argv[1:])
+    if argv and argv[0] == "listen":
+        argv = argv[1:]
+    return listen(argv)
+
+
 if __name__ == "__main__":
     main()
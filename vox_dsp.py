@@ -0,0 +1,265 @@
+"""Receive-side processing chain for the Vox listener.
+
+Every stage works on whole float32 blocks of shape (frames, channels) with
+state preallocated at construction; there is no per-sample Python in the
+audio path. Recursive filters are evaluated in closed form per block.
+"""
+import math
+import time
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Bypass order when over budget: cosmetic stages go first, the limiter that
+# protects the speakers goes last.
+BYPASS_ORDER = ("eq", "agc", "limiter")
+COST_SMOOTHING = 0.1  # EWMA weight of the newest per-block stage cost
+RETRY_SECONDS = 5.0  # how long a bypassed stage stays off before a retry
+
+
+def biquad_coefficients(kind, freq, gain_db, q, samplerate):
+    """RBJ cookbook coefficients, normalized so a0 == 1: (b0, b1, b2, a1, a2)."""
+    amp = 10 ** (gain_db / 40)
+    w0 = 2 * math.pi * freq / samplerate
+    cos_w0 = math.cos(w0)
+    alpha = math.sin(w0) / (2 * q)
+    if kind == "peak":
+        b = (1 + alpha * amp, -2 * cos_w0, 1 - alpha * amp)
+        a = (1 + alpha / amp, -2 * cos_w0, 1 - alpha / amp)
+    elif kind in ("lowshelf", "highshelf"):
+        sign = 1 if kind == "lowshelf" else -1
+        sq = 2 * math.sqrt(amp) * alpha
+        b = (
+            amp * ((amp + 1) - sign * (amp - 1) * cos_w0 + sq),
+            sign * 2 * amp * ((amp - 1) - sign * (amp + 1) * cos_w0),
+            amp * ((amp + 1) - sign * (amp - 1) * cos_w0 - sq),
+        )
+        a = (
+            (amp + 1) + sign * (amp - 1) * cos_w0 + sq,
+            -sign * 2 * ((amp - 1) + sign * (amp + 1) * cos_w0),
+            (amp + 1) + sign * (amp - 1) * cos_w0 - sq,
+        )
+    else:
+        raise ValueError(f"unknown filter type '{kind}'")
+    return b[0] / a[0], b[1] / a[0], b[2] / a[0], a[1] / a[0], a[2] / a[0]
+
+
+def block_response(coeffs, blocksize):
+    """Spectrum H and matrix G (n, 4) with y = conv(h, x)[:n] + G @ [x-1, x-2, y-1, y-2].
+
+    The direct-form-I recursion is linear, so a whole block follows from the
+    input block (convolved with the impulse response truncated to the block,
+    via a zero-padded FFT) and the two previous inputs/outputs. Built once
+    per filter.
+    """
+    b0, b1, b2, a1, a2 = coeffs
+
+    def run(x, state):
+        x1, x2, y1, y2 = state
+        y = np.empty(blocksize)
+        for n in range(blocksize):
+            y[n] = b0 * x[n] + b1 * x1 + b2 * x2 - a1 * y1 - a2 * y2
+            x2, x1 = x1, x[n]
+            y2, y1 = y1, y[n]
+        return y
+
+    impulse = np.zeros(blocksize)
+    impulse[0] = 1.0
+    h = run(impulse, (0.0, 0.0, 0.0, 0.0))
+    silence = np.zeros(blocksize)
+    initial = np.stack([run(silence, unit) for unit in np.eye(4)], axis=1)
+    return np.fft.rfft(h, 2 * blocksize)[:, None], initial.astype(np.float32)
+
+
+class Equalizer:
+    """Cascade of biquad bands, each applied to a block with one FFT convolution."""
+
+    name = "eq"
+
+    def __init__(self, bands, samplerate, channels, blocksize):
+        self.blocksize = blocksize
+        self.bands = [block_response(biquad_coefficients(*band, samplerate), blocksize) for band in bands]
+        self._states = [np.zeros((4, channels), dtype=np.float32) for _ in self.bands]
+        self._buffers = [np.empty((blocksize, channels), dtype=np.float32) for _ in range(2)]
+        self._carry = np.empty((blocksize, channels), dtype=np.float32)
+
+    def reset(self):
+        for state in self._states:
+            state.fill(0)
+
+    def process(self, block):
+        n = self.blocksize
+        for i, ((spectrum, initial), state) in enumerate(zip(self.bands, self._states)):
+            out = self._buffers[i % 2]
+            out[:] = np.fft.irfft(spectrum * np.fft.rfft(block, 2 * n, axis=0), 2 * n, axis=0)[:n]
+            np.matmul(initial, state, out=self._carry)
+            out += self._carry
+            state[0] = block[-1]
+            state[1] = block[-2]
+            state[2] = out[-1]
+            state[3] = out[-2]
+            block = out
+        return block
+
+
+class AutoGain:
+    """Slow AGC toward a target RMS level, gain ramped linearly across each block."""
+
+    name = "agc"
+
+    def __init__(
+        self,
+        target_db,
+        samplerate,
+        blocksize,
+        time_constant=3.0,
+        max_boost_db=12.0,
+        max_cut_db=12.0,
+        gate_db=-50.0,
+    ):
+        self.target_db = target_db
+        self.max_boost_db = max_boost_db
+        self.max_cut_db = max_cut_db
+        self.gate_db = gate_db
+        self.coeff = math.exp(-blocksize / samplerate / time_constant)
+        self._ramp = (np.arange(blocksize, dtype=np.float32) / blocksize)[:, None]
+        self._envelope = np.empty_like(self._ramp)
+        self.reset()
+
+    def reset(self):
+        self.gain = 1.0
+        self.level_db = self.target_db
+
+    def process(self, block):
+        flat = block.reshape(-1)
+        level_db = 10 * math.log10(float(np.dot(flat, flat)) / flat.size + 1e-12)
+        # Hold the estimate through silence so pauses do not pump the gain up.
+        if level_db > self.gate_db:
+            self.level_db = self.coeff * self.level_db + (1 - self.coeff) * level_db
+        gain_db = min(self.max_boost_db, max(-self.max_cut_db, self.target_db - self.level_db))
+        gain = 10 ** (gain_db / 20)
+        np.multiply(self._ramp, gain - self.gain, out=self._envelope)
+        self._envelope += self.gain
+        block *= self._envelope
+        self.gain = gain
+        return block
+
+
+class Limiter:
+    """Look-ahead peak limiter; output peaks never exceed the ceiling.
+
+    The gain for each sample is the minimum target gain over the look-ahead
+    window, released at a fixed dB/s rate and smoothed with a boxcar of the
+    same length. The release recursion min(target, previous + rate) is
+    solved for a whole block with a cumulative minimum.
+    """
+
+    name = "limiter"
+
+    def __init__(self, ceiling_db, samplerate, channels, blocksize, lookahead_ms=1.5, release_db_per_s=60.0):
+        self.ceiling_db = ceiling_db
+        self.window = max(2, int(samplerate * lookahead_ms / 1000))
+        self.history = self.window - 1
+        self.blocksize = blocksize
+        self.release = release_db_per_s / samplerate
+        self._ramp = self.release * np.arange(blocksize)
+        total = self.history + blocksize
+        self._target_db = np.empty(total)
+        self._gain = np.empty(total)
+        self._delay = np.empty((total, channels), dtype=np.float32)
+        self._out = np.empty((blocksize, channels), dtype=np.float32)
+        self.reset()
+
+    def reset(self):
+        self._target_db.fill(0)
+        self._gain.fill(1)
+        self._delay.fill(0)
+        self.gain_db = 0.0
+
+    def process(self, block):
+        hist = self.history
+        target = self._target_db[hist:]
+        np.abs(block).max(axis=1, out=self._out[:, 0])
+        np.maximum(self._out[:, 0], 1e-9, out=target)
+        np.log10(target, out=target)
+        target *= -20
+        target += self.ceiling_db
+        np.minimum(target, 0, out=target)
+
+        gain_db = sliding_window_view(self._target_db, self.window).min(axis=1)
+        gain_db -= self._ramp
+        gain_db[0] = min(gain_db[0], self.gain_db + self.release)
+        np.minimum.accumulate(gain_db, out=gain_db)
+        gain_db += self._ramp
+        self.gain_db = float(gain_db[-1])
+        gain = self._gain[hist:]
+        np.multiply(gain_db, 1 / 20, out=gain)
+        np.power(10.0, gain, out=gain)
+        smoothed = sliding_window_view(self._gain, self.window).mean(axis=1)
+
+        self._delay[hist:] = block
+        np.multiply(self._delay[: self.blocksize], smoothed[:, None], out=self._out)
+        self._delay[:hist] = self._delay[self.blocksize :]
+        self._target_db[:hist] = self._target_db[self.blocksize :]
+        self._gain[:hist] = self._gain[self.blocksize :]
+        return self._out
+
+
+class DspChain:
+    """Runs stages in order, timing each against a per-block CPU budget.
+
+    When the smoothed cost of the active stages exceeds the budget, stages
+    are bypassed in BYPASS_ORDER; a bypassed stage is reset and retried
+    after RETRY_SECONDS.
+    """
+
+    def __init__(self, stages, budget, block_seconds):
+        self.stages = stages
+        self.budget = budget
+        self.block_seconds = block_seconds
+        self.retry_blocks = max(1, int(RETRY_SECONDS / block_seconds))
+        self.cost = {stage.name: 0.0 for stage in stages}
+        self.bypassed = {}
+        self.overruns = 0
+
+    def reset(self):
+        for stage in self.stages:
+            stage.reset()
+            self.cost[stage.name] = 0.0
+        self.bypassed.clear()
+        self.overruns = 0
+
+    def process(self, block):
+        for stage in self.stages:
+            if stage.name in self.bypassed:
+                continue
+            start = time.perf_counter()
+            block = stage.process(block)
+            elapsed = time.perf_counter() - start
+            self.cost[stage.name] += COST_SMOOTHING * (elapsed - self.cost[stage.name])
+        self._enforce_budget()
+        return block
+
+    def _enforce_budget(self):
+        for name in list(self.bypassed):
+            self.bypassed[name] -= 1
+            if self.bypassed[name] <= 0:
+                del self.bypassed[name]
+                self.cost[name] = 0.0
+                next(stage for stage in self.stages if stage.name == name).reset()
+        active = [stage.name for stage in self.stages if stage.name not in self.bypassed]
+        if sum(self.cost[name] for name in active) <= self.budget:
+            return
+        self.overruns += 1
+        for name in BYPASS_ORDER:
+            if name in active:
+                self.bypassed[name] = self.retry_blocks
+                return
+
+    def summary(self):
+        costs = ", ".join(f"{stage.name} {self.cost[stage.name] * 1000:.2f} ms" for stage in self.stages)
+        bypassed = ", ".join(self.bypassed) or "none"
+        return (
+            f"{costs} of {self.budget * 1000:.1f} ms budget ({self.block_seconds * 1000:.1f} ms block); "
+            f"bypassed: {bypassed}; overruns {self.overruns}"
+        )
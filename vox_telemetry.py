@@ -0,0 +1,70 @@
+"""Receive-path telemetry for the Vox listener GUI.
+
+The receive thread builds a new immutable Snapshot per block and publishes
+it by rebinding a single attribute, which is atomic under the GIL. Readers
+(the Tk timer, console reports) never take a lock and never block the
+writer; they simply see the latest snapshot.
+
+Received datagrams and analysed blocks are counted separately: with a trunk
+one datagram carries many streams' blocks, and only the monitored stream's
+blocks reach the meters.
+"""
+import time
+from collections import namedtuple
+
+import numpy as np
+
+SPECTRUM_EVERY = 2  # analyse every Nth block
+SPECTRUM_BATCH = 4  # sampled blocks per batched FFT (~6 spectra/s at 47 blocks/s)
+SPECTRUM_BANDS = 48  # log-spaced display bands before merging duplicate bins
+SPECTRUM_MIN_HZ = 40.0
+COST_SMOOTHING = 0.05  # EWMA weight of the newest per-block cost
+
+Snapshot = namedtuple("Snapshot", "blocks peak rms spectrum")
+
+
+class Telemetry:
+    def __init__(self, channels, blocksize, samplerate, meters=True):
+        self.channels = channels
+        self.meters = meters
+        self._batch = np.zeros((SPECTRUM_BATCH, blocksize), dtype=np.float32)
+        self._window = np.hanning(blocksize).astype(np.float32)
+        freqs = np.fft.rfftfreq(blocksize, 1 / samplerate)
+        edges = np.searchsorted(freqs, np.geomspace(SPECTRUM_MIN_HZ, samplerate / 2, SPECTRUM_BANDS + 1))
+        self._band_starts = np.unique(np.clip(edges[:-1], 0, len(freqs) - 1))
+        # A full-scale sine through the Hann window peaks at blocksize / 4.
+        self._full_scale = (blocksize / 4) ** 2
+        self.band_count = len(self._band_starts)
+        self.reset()
+
+    def reset(self):
+        silent = np.zeros(self.channels, dtype=np.float32)
+        self.packets = 0
+        self.blocks = 0
+        self.spectrum = None
+        self.cost = 0.0
+        self._filled = 0
+        self.snapshot = Snapshot(0, silent, silent, None)
+
+    def received(self):
+        self.packets += 1
+
+    def update(self, block):
+        start = time.perf_counter()
+        self.blocks += 1
+        if self.meters:
+            peak = np.abs(block).max(axis=0)
+            rms = np.sqrt(np.einsum("ij,ij->j", block, block) / len(block))
+            if self.blocks % SPECTRUM_EVERY == 0:
+                np.mean(block, axis=1, out=self._batch[self._filled])
+                self._filled += 1
+                if self._filled == SPECTRUM_BATCH:
+                    self._filled = 0
+                    self.spectrum = self._analyse()
+            self.snapshot = Snapshot(self.blocks, peak, rms, self.spectrum)
+        self.cost += COST_SMOOTHING * (time.perf_counter() - start - self.cost)
+
+    def _analyse(self):
+        power = np.abs(np.fft.rfft(self._batch * self._window, axis=1)) ** 2
+        bands = np.maximum.reduceat(power.mean(axis=0), self._band_starts)
+        return 10 * np.log10(bands / self._full_scale + 1e-12)
@@ -0,0 +1,211 @@
+"""Trunk wire format: blocks from several streams in few UDP datagrams.
+
+A datagram is a header, a table of contents with one entry per fragment,
+then the fragment payloads back to back in TOC order:
+
+    header  <2sBBI    magic b"VT", version, fragment count, tick
+    entry   <HBBHHH   stream id, codec, channels, offset, length, block total
+
+Each block is one CHUNK of audio from one source. A tick's blocks are laid
+end to end and cut into datagrams no larger than the limit, splitting a
+block wherever a datagram fills up. The default limit is three IP fragments
+on a 1500-byte Ethernet MTU, the same wire shape as one plain pcm16 block;
+MTU_DATAGRAM avoids IP fragmentation altogether. The receiver reassembles blocks per stream;
+losing a datagram loses only the blocks that had a fragment in it.
+"""
+import struct
+
+import numpy as np
+
+MAGIC = b"VT"
+VERSION = 2
+HEADER = struct.Struct("<2sBBI")
+ENTRY = struct.Struct("<HBBHHH")
+MTU_DATAGRAM = 1472  # 1500-byte Ethernet MTU minus IPv4 and UDP headers
+DEFAULT_DATAGRAM = 3 * 1480 - 8  # three full IPv4 fragments on that MTU
+MAX_DATAGRAM = 65507  # largest UDP payload over IPv4
+MIN_DATAGRAM = 128
+MIN_FRAGMENT = 64  # don't split a block to fill fewer bytes than this
+MAX_BLOCKS = 255
+# Ticks a stream must have moved past before an older tick is accepted again
+# (a restarted sender counts from 0).
+STALE_TICKS = 64
+
+CODEC_PCM16 = 0
+CODEC_MULAW = 1
+CODECS = {"pcm16": CODEC_PCM16, "mulaw": CODEC_MULAW}
+
+MULAW_BIAS = 0x84
+MULAW_CLIP = 32635
+
+
+def _mulaw_tables():
+    # G.711 mu-law, tabulated once for every int16 value (encode) and every
+    # byte (decode) so both directions are a single vectorized lookup.
+    values = np.arange(65536, dtype=np.uint16).view(np.int16).astype(np.int32)
+    sign = np.where(values < 0, 0x80, 0)
+    magnitude = np.minimum(np.abs(values), MULAW_CLIP) + MULAW_BIAS
+    exponent = np.floor(np.log2(magnitude)).astype(np.int32) - 7
+    mantissa = (magnitude >> (exponent + 3)) & 0x0F
+    encode = (~(sign | (exponent << 4) | mantissa) & 0xFF).astype(np.uint8)
+
+    codes = ~np.arange(256, dtype=np.int32) & 0xFF
+    decoded = (((codes & 0x0F) << 3) + MULAW_BIAS) << ((codes >> 4) & 0x07)
+    decoded -= MULAW_BIAS
+    decoded = np.where(codes & 0x80, -decoded, decoded)
+    return encode, (decoded / 32768.0).astype(np.float32)
+
+
+MULAW_ENCODE, MULAW_DECODE = _mulaw_tables()
+
+
+def encode(pcm, codec):
+    """Encode raw s16le PCM bytes with the given codec id."""
+    if codec == CODEC_PCM16:
+        return pcm
+    if codec == CODEC_MULAW:
+        return MULAW_ENCODE[np.frombuffer(pcm, dtype=np.uint16)].tobytes()
+    raise ValueError(f"unknown codec {codec}")
+
+
+def decode(payload, codec, channels):
+    """Decode a block payload to float32 frames of shape (frames, channels)."""
+    if codec == CODEC_PCM16:
+        block = np.frombuffer(payload, dtype=np.int16).astype(np.float32)
+        block *= 1.0 / 32768
+    elif codec == CODEC_MULAW:
+        block = MULAW_DECODE[np.frombuffer(payload, dtype=np.uint8)]
+    else:
+        raise ValueError(f"unknown codec {codec}")
+    return block.reshape(-1, channels)
+
+
+class TrunkPacker:
+    def __init__(self, max_datagram=DEFAULT_DATAGRAM):
+        if not MIN_DATAGRAM <= max_datagram <= MAX_DATAGRAM:
+            raise ValueError(f"datagram limit must be {MIN_DATAGRAM}..{MAX_DATAGRAM} bytes")
+        self.max_datagram = max_datagram
+        self.tick = 0
+
+    def pack(self, blocks):
+        """Pack one tick of (stream id, codec, channels, payload) tuples into datagrams.
+
+        Blocks fill datagrams in order and are split wherever a datagram is
+        full; every fragment carries its offset into the block.
+        """
+        datagrams = []
+        group = []
+        size = HEADER.size
+        for stream_id, codec, channels, payload in blocks:
+            total = len(payload)
+            if total > 0xFFFF:
+                raise ValueError(f"block of {total} bytes is too large for a trunk")
+            payload = memoryview(payload)
+            offset = 0
+            while offset < total:
+                room = self.max_datagram - size - ENTRY.size
+                if len(group) == MAX_BLOCKS or (room < MIN_FRAGMENT and room < total - offset):
+                    datagrams.append(self._build(group))
+                    group = []
+                    size = HEADER.size
+                    continue
+                length = min(room, total - offset)
+                group.append((stream_id, codec, channels, offset, total, payload[offset : offset + length]))
+                size += ENTRY.size + length
+                offset += length
+        if group:
+            datagrams.append(self._build(group))
+        self.tick = (self.tick + 1) & 0xFFFFFFFF
+        return datagrams
+
+    def _build(self, group):
+        parts = [HEADER.pack(MAGIC, VERSION, len(group), self.tick)]
+        parts.extend(
+            ENTRY.pack(stream_id, codec, channels, offset, len(payload), total)
+            for stream_id, codec, channels, offset, total, payload in group
+        )
+        parts.extend(payload for *_, payload in group)
+        return b"".join(parts)
+
+
+def unpack(datagram):
+    """Split a trunk datagram into its tick and fragment tuples.
+
+    Fragments are (stream id, codec, channels, offset, total, payload), with
+    payloads as memoryviews into the datagram. Raises ValueError for
+    anything that is not a valid trunk.
+    """
+    if len(datagram) < HEADER.size:
+        raise ValueError("datagram shorter than trunk header")
+    magic, version, count, tick = HEADER.unpack_from(datagram)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("not a trunk datagram")
+    view = memoryview(datagram)
+    offset = HEADER.size + count * ENTRY.size
+    if offset > len(datagram):
+        raise ValueError("truncated table of contents")
+    fragments = []
+    for stream_id, codec, channels, block_offset, length, total in ENTRY.iter_unpack(view[HEADER.size : offset]):
+        if offset + length > len(datagram) or channels == 0 or block_offset + length > total:
+            raise ValueError("truncated or malformed block")
+        fragments.append((stream_id, codec, channels, block_offset, total, view[offset : offset + length]))
+        offset += length
+    return tick, fragments
+
+
+class TrunkReassembler:
+    """Rebuilds blocks split across datagrams.
+
+    Partial blocks are kept per stream for the current tick only; a block
+    missing any fragment is dropped when the stream's next tick arrives, so
+    a lost datagram costs just the blocks it carried. A block completes only
+    once its fragments cover every byte, so duplicated datagrams cannot
+    release it with a gap, and is released once per tick.
+    """
+
+    def __init__(self):
+        self._partial = {}
+        self._done = {}
+
+    def feed(self, datagram):
+        """Return the (stream id, codec, channels, payload) blocks completed by a datagram."""
+        tick, fragments = unpack(datagram)
+        complete = []
+        for stream_id, codec, channels, offset, total, payload in fragments:
+            done = self._done.get(stream_id)
+            if done is not None and (done - tick) & 0xFFFFFFFF < STALE_TICKS:
+                continue  # block of this tick already played, or an older one
+            if offset == 0 and len(payload) == total:
+                self._done[stream_id] = tick
+                complete.append((stream_id, codec, channels, payload))
+                continue
+            partial = self._partial.get(stream_id)
+            if partial is not None and partial[0] != tick:
+                if (tick - partial[0]) & 0xFFFFFFFF >= 0x80000000:
+                    continue  # late fragment of an older tick
+                partial = None
+            if partial is None or partial[1:3] != [codec, channels] or len(partial[3]) != total:
+                # [tick, codec, channels, buffer, {offset: end}]
+                partial = [tick, codec, channels, bytearray(total), {}]
+                self._partial[stream_id] = partial
+            end = offset + len(payload)
+            ranges = partial[4]
+            if ranges.get(offset, -1) >= end:
+                continue  # duplicate
+            partial[3][offset:end] = payload
+            ranges[offset] = end
+            if _covered(ranges) >= total:
+                del self._partial[stream_id]
+                self._done[stream_id] = tick
+                complete.append((stream_id, codec, channels, partial[3]))
+        return complete
+
+
+def _covered(ranges):
+    # Length of the prefix covered without gaps by the {offset: end} ranges.
+    covered = 0
+    for offset in sorted(ranges):
+        if offset > covered:
+            break
+        covered = max(covered, ranges[offset])
+    return covered